@@ -30,9 +30,13 @@ def substitute_spans(example: Example, span_subs: Dict[Span, str]) -> Example:
     Returns:
         Example: Output example with substituted spans
     """
-    span_sub_start_counter = 0
-
-    new_example_text = example.text
+    # Collect the pieces of the new text and join them once at the end.
+    # Offsets of every span after a substitution move by the same running
+    # shift that the text pieces accumulate.
+    text = example.text
+    text_pieces = []
+    text_cursor = 0
+    shift = 0
     new_example_spans = []
 
     prev_example_spans = {hash(span) for span in example.spans}
@@ -41,36 +45,28 @@ def substitute_spans(example: Example, span_subs: Dict[Span, str]) -> Example:
     for span in spans:
         should_add_span = hash(span) in prev_example_spans
 
+        prev_start = span.start
         prev_end = span.end
-        new_text = span.text
 
         if span in span_subs:
             new_text = span_subs[span]
-            new_start = span.start + span_sub_start_counter
-            new_end = new_start + len(new_text)
-
-            new_example_text = (
-                new_example_text[: span.start + span_sub_start_counter]
-                + new_text
-                + new_example_text[span.end + span_sub_start_counter :]
-            )
+            text_pieces.append(text[text_cursor:prev_start])
+            text_pieces.append(new_text)
+            text_cursor = prev_end
 
             span.text = new_text
-            span.start = new_start
-            span.end = new_end
-
-            span_sub_start_counter += new_end - prev_end
-        else:
-            span.start += span_sub_start_counter
+            span.start = prev_start + shift
             span.end = span.start + len(new_text)
-            span_sub_start_counter = span.end - prev_end
-
-        span.text = new_text
+            shift += len(new_text) - (prev_end - prev_start)
+        else:
+            span.start = prev_start + shift
+            span.end = prev_end + shift
 
         if should_add_span:
             new_example_spans.append(span)
 
-    example.text = new_example_text
+    text_pieces.append(text[text_cursor:])
+    example.text = "".join(text_pieces)
     example.spans = new_example_spans
 
     return example
@@ -86,12 +82,12 @@ def augment_example(
     **kwargs: Any,
 ) -> List[Example]:
     if spans is None:
-        spans = example.model_copy(deep=True).spans
+        # Span fields are all immutable scalars so a shallow copy is enough
+        spans = [s.model_copy() for s in example.spans]
 
     augmented_examples = {example}
 
     for _ in range(n_augs):
-        example = example.model_copy(deep=True)
         if span_label:
             spans = [s for s in spans if s.label == span_label]
         mask = mask_1d(len(spans), prob=sub_prob)
@@ -106,6 +102,8 @@ def augment_example(
         if not any(span_subs.values()) or len(augmented_examples) > n_augs:
             break
 
+        # Only copy once there is a substitution to make
+        example = example.model_copy(deep=True)
         example = substitute_spans(example, span_subs)
         if example not in augmented_examples:
             augmented_examples.add(example)
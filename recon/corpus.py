@@ -216,7 +216,9 @@ class Corpus:
             corpus_meta = CorpusMeta.model_validate(srsly.read_json(corpus_meta_path))
             name = corpus_meta.name
 
-        example_store_path = data_dir / ".recon" / "example_store.jsonl"
+        example_store_path = data_dir / ".recon" / "example_store.msgpack"
+        if not example_store_path.exists():
+            example_store_path = example_store_path.with_suffix(".jsonl")
         example_store = ExampleStore()
         if example_store_path.exists():
             example_store.from_disk(example_store_path)
@@ -258,7 +260,7 @@ class Corpus:
         self._dev.to_disk(data_dir, overwrite=overwrite, save_examples=False)
         if self._test:
             self._test.to_disk(data_dir, overwrite=overwrite, save_examples=False)
-        self.example_store.to_disk(state_dir / "example_store.jsonl")
+        self.example_store.to_disk(state_dir / "example_store.msgpack")
 
     @classmethod
     def from_prodigy(
@@ -60,7 +60,7 @@ def fix_annotations(
 
     ents_to_remove: List[int] = []
     for i, s in enumerate(example.spans):
-        t = s.text if case_sensitive else s.text.lower()
+        t = s.text if case_sensitive else s.text_lower
 
         if t in corrections_map:
             c = corrections_map[t]
@@ -2,7 +2,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
-import spacy
 import srsly
 from spacy.tokens import Doc
 from wasabi import Printer
@@ -23,7 +22,7 @@ from recon.types import (
     Token,
     TransformationType,
 )
-from recon.util import ensure_path
+from recon.util import ensure_path, get_blank_nlp
 
 if TYPE_CHECKING:
     try:
@@ -90,6 +89,7 @@ class Dataset:
         self._example_store = example_store
         self._verbose = verbose
         self._stats: Optional[Stats] = None
+        self._stats_hash: Optional[int] = None
 
     @property
     def name(self) -> str:
@@ -119,11 +119,18 @@ class Dataset:
 
     @property
     def stats(self) -> Stats:
-        return get_ner_stats(self.data)
+        """NER stats for the Dataset. Cached until the commit hash changes,
+        so any change to the data, including in place edits, is picked up.
+        """
+        commit_hash = self.commit_hash
+        if self._stats is None or self._stats_hash != commit_hash:
+            self._stats = get_ner_stats(self.data)
+            self._stats_hash = commit_hash
+        return self._stats
 
     @property
     def labels(self) -> Tuple[str, ...]:
-        n_anns_per_type = get_ner_stats(self.data).n_annotations_per_type
+        n_anns_per_type = self.stats.n_annotations_per_type
         return tuple(n_anns_per_type.keys())
 
     def summary(self) -> str:
@@ -270,14 +277,17 @@ class Dataset:
         examples_to_remove = set()
         examples_to_add = []
 
+        # Validated Transformations always hold TransformationType members
+        # so the type can be checked by identity
         for op in self.operations[-n:]:
             for t in op.transformations:
-                if t.type == TransformationType.EXAMPLE_ADDED:
+                t_type = t.type
+                if t_type is TransformationType.EXAMPLE_ADDED:
                     examples_to_remove.add(t.example)
-                elif t.type == TransformationType.EXAMPLE_CHANGED:
+                elif t_type is TransformationType.EXAMPLE_CHANGED:
                     examples_to_remove.add(t.example)
                     examples_to_add.append(store[t.prev_example])  # type: ignore
-                elif t.type == TransformationType.EXAMPLE_REMOVED:
+                elif t_type is TransformationType.EXAMPLE_REMOVED:
                     examples_to_add.append(store[t.prev_example])  # type: ignore
 
         old_data = [e for e in self.data if hash(e) not in examples_to_remove]
@@ -340,7 +350,9 @@ class Dataset:
             state = DatasetOperationsState(**state)
             self._operations = state.operations
 
-            example_store_path = path / ".recon" / self.name / "example_store.jsonl"
+            example_store_path = path / ".recon" / self.name / "example_store.msgpack"
+            if not example_store_path.exists():
+                example_store_path = example_store_path.with_suffix(".jsonl")
             if example_store_path.exists():
                 self._example_store.from_disk(example_store_path)
 
@@ -417,7 +429,7 @@ class Dataset:
         srsly.write_json(state_dir / "state.json", state.model_dump())
 
         if save_examples:
-            self.example_store.to_disk(state_dir / "example_store.jsonl")
+            self.example_store.to_disk(state_dir / "example_store.msgpack")
 
         srsly.write_jsonl(
             output_dir / f"{self.name}.jsonl",
@@ -499,7 +511,7 @@ class Dataset:
         labels: List[str] = [],
         lang: str = "en",
     ) -> "Dataset":
-        nlp = spacy.blank(lang)
+        nlp = get_blank_nlp(lang)
         examples = []
         for e in hf_dataset:
             e = cast(Dict[str, Any], e)
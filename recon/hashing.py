@@ -48,15 +48,31 @@ def example_hash(example: "Example") -> int:
     Returns:
         str: Example hash
     """
-    hash_data = [example.text]
+    m = xxhash.xxh3_64(example.text.encode("utf-8"))
     for span in example.spans:
-        hash_data += [
-            span.start,
-            span.end,
-            span.label,
-            span.text,
-        ]
-    return _hash(tuple(hash_data))
+        m.update(span._example_hash_data)
+    return m.intdigest()
+
+
+def span_example_hash_data(span: "Span") -> bytes:
+    """Encoded Span data that is fed into the hash of its Example.
+    Spans cache this value so an Example with unchanged spans can be
+    rehashed without re-encoding each of them.
+
+    Args:
+        span (Span): Span to encode
+
+    Returns:
+        bytes: Encoded Span data
+    """
+    return b"".join(
+        (
+            str(span.start).encode("utf-8"),
+            str(span.end).encode("utf-8"),
+            span.label.encode("utf-8"),
+            span.text.encode("utf-8"),
+        )
+    )
 
 
 def tokenized_example_hash(example: "Example") -> int:
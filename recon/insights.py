@@ -39,7 +39,7 @@ def get_ents_by_label(
     )
     for example in data:
         for s in example.spans:
-            span_text = s.text if case_sensitive else s.text.lower()
+            span_text = s.text if case_sensitive else s.text_lower
             annotations[s.label][span_text].add(example)
     return annotations
 
@@ -309,7 +309,7 @@ def get_annotation_labels(
     )
     for e in examples:
         for s in e.spans:
-            text = s.text if case_sensitive else s.text.lower()
+            text = s.text if case_sensitive else s.text_lower
             annotation_labels_map[text][s.label].append(e)
 
     return annotation_labels_map
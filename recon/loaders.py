@@ -5,14 +5,17 @@ the [Prodigy](https://prodi.gy) format.
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, cast
 
-import spacy
 import srsly
+from pydantic import TypeAdapter
 from spacy.language import Language
 from spacy.tokens import Doc, DocBin
 from spacy.tokens import Span as SpacySpan
 from spacy.util import get_words_and_spaces
 
 from recon.types import Example, Span, Token
+from recon.util import get_blank_nlp
+
+_EXAMPLES_ADAPTER = TypeAdapter(List[Example])
 
 
 def read_jsonl(path: Path) -> List[Example]:
@@ -52,7 +55,7 @@ def json_to_examples(data: List[Dict[str, Any]]) -> List[Example]:
     Returns:
         List[Example]: List of typed Examples
     """
-    return [Example(**example) for example in data]
+    return _EXAMPLES_ADAPTER.validate_python(data)
 
 
 def from_spacy(
@@ -70,7 +73,7 @@ def from_spacy(
         Iterable[Example]: List of typed Examples
     """
     if not nlp:
-        nlp = spacy.blank(lang_code)
+        nlp = get_blank_nlp(lang_code)
 
     doc_bin = DocBin().from_disk(path)
     for doc in doc_bin.get_docs(nlp.vocab):
@@ -113,7 +116,7 @@ def to_spacy(
     """
 
     if not nlp:
-        nlp = spacy.blank(lang_code)
+        nlp = get_blank_nlp(lang_code)
 
     doc_bin = DocBin(attrs=["ENT_IOB", "ENT_TYPE"])
     for example in data:
@@ -1,6 +1,6 @@
 import inspect
 import warnings
-from collections import Counter, defaultdict
+from collections import Counter
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import catalogue
@@ -45,19 +45,21 @@ def op_iter(
         Iterator[Tuple[int, Example]]: Tuples of (example hash, example)
     """
     msg = Printer(no_print=not verbose, hide_animation=not verbose)
-    preprocessed_outputs: Dict[Example, Dict[str, Any]] = defaultdict(dict)
+    # Outputs line up with data by position so examples don't need to be
+    # hashed to look them up
+    preprocessed_outputs: List[Dict[str, Any]] = [{} for _ in data]
     for processor in pre:
         msg.info(f"\t=> Running preprocessor {processor.name}")
         processor_outputs = processor(data)
-        for example, output in tqdm(
-            zip(data, processor_outputs),
+        for outputs, output in tqdm(
+            zip(preprocessed_outputs, processor_outputs),
             total=len(data),
             disable=(not verbose),
             leave=False,
         ):
-            preprocessed_outputs[example][processor.name] = output
-    for example in data:
-        yield hash(example), example, preprocessed_outputs[example]
+            outputs[processor.name] = output
+    for example, outputs in zip(data, preprocessed_outputs):
+        yield hash(example), example, outputs
 
 
 class operation:
@@ -246,7 +248,7 @@ class Operation:
                         if hash(new_example) == orig_example_hash:
                             old_example_present = True
                         else:
-                            track_add_example(new_example.model_copy(deep=True))
+                            track_add_example(new_example)
                     if not old_example_present:
                         track_remove_example(orig_example_hash)
                 else:
@@ -71,9 +71,27 @@ class SpacyPreProcessor(PreProcessor):
         nlp: Optional[Language] = None,
         name: str = "recon.spacy.v1",
         field: str = "doc",
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
     ) -> None:
+        """Run a spaCy pipeline over each Example's text.
+
+        Args:
+            nlp (Optional[Language], optional): spaCy pipeline to use.
+                Defaults to a blank English pipeline with a sentencizer.
+            name (str, optional): Name to register the preprocessor under.
+            field (str, optional): Output field name.
+            batch_size (Optional[int], optional): Batch size passed to nlp.pipe.
+                Defaults to the pipeline's own batch size.
+            n_process (int, optional): Number of processes passed to nlp.pipe,
+                -1 uses all available cores. Multiprocessing only pays off for
+                large datasets and shouldn't be combined with a pipeline
+                running on GPU. Defaults to 1.
+        """
         super().__init__(name, field)
         self._nlp = nlp
+        self.batch_size = batch_size
+        self.n_process = n_process
 
     @property
     def nlp(self) -> Language:
@@ -83,12 +101,16 @@ class SpacyPreProcessor(PreProcessor):
         return self._nlp
 
     def __call__(self, data: Iterable[Example]) -> Iterable[Any]:
-        unseen_texts = (
+        unseen_texts = [
             e.text for i, e in enumerate(data) if hash(e) not in self._cache
-        )
+        ]
         seen_texts = ((i, e.text) for i, e in enumerate(data) if hash(e) in self._cache)
 
-        docs = list(self.nlp.pipe(unseen_texts))
+        docs = list(
+            self.nlp.pipe(
+                unseen_texts, batch_size=self.batch_size, n_process=self.n_process
+            )
+        )
         for doc in docs:
             self._cache[doc.text] = doc
         for idx, st in seen_texts:
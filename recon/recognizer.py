@@ -104,9 +104,9 @@ class SpacyEntityRecognizer(EntityRecognizer):
 
         for pipe in ["ner", "entity_ruler"]:
             if self.nlp.has_pipe(pipe):
-                all_labels = all_labels | set(self.nlp.get_pipe(pipe).labels)  # type: ignore
+                all_labels.update(self.nlp.get_pipe(pipe).labels)  # type: ignore
 
-        return sorted(list(all_labels))
+        return sorted(all_labels)
 
     def predict(self, texts: Iterable[str]) -> Iterator[Example]:
         """Run spaCy nlp.pipe on a batch of raw texts.
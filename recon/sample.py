@@ -1,9 +1,10 @@
 import random
-from collections import defaultdict
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, FrozenSet, List, Tuple
 
 from recon.types import Example
 
+_MISSING = object()
+
 
 def hash_example_meta(
     example: Example, fields: List[str] = [], ignore_field_absence: bool = False
@@ -23,27 +24,50 @@ def hash_example_meta(
     Returns:
         Tuple: Tuple of hashable attributes from the meta of an example
     """
+    meta = example.meta
     if not fields:
-        fields = list(example.meta.keys())
+        fields = list(meta.keys())
 
-    tpl = []
+    tpl: List[Any] = []
+    append = tpl.append
     for field in fields:
-        tpl.append(field)
-        if field not in example.meta:
+        append(field)
+        meta_val = meta.get(field, _MISSING)
+        if meta_val is _MISSING:
             if ignore_field_absence:
                 continue
             raise ValueError(
                 f"Field {field} not present in 'meta' for example {example}"
             )
-        meta_val = example.meta[field]
         if isinstance(meta_val, list):
-            tpl += meta_val
+            tpl.extend(meta_val)
         else:
-            tpl.append(meta_val)
+            append(meta_val)
 
     return tuple(tpl)
 
 
+def _meta_value_allowed(value: Any, allowed: FrozenSet[Any]) -> bool:
+    """Check whether a meta value passes a meta filter. List values
+    (e.g. the "source" list set when meta is passed as a list) match
+    if any of their items is allowed.
+
+    Args:
+        value (Any): Meta value of an example
+        allowed (FrozenSet[Any]): Allowed values for the meta field
+
+    Returns:
+        bool: Whether the value is allowed
+    """
+    if isinstance(value, list):
+        return any(_meta_value_allowed(v, allowed) for v in value)
+    try:
+        return value in allowed
+    except TypeError:
+        # Other unhashable values can't be in the set of allowed values
+        return False
+
+
 def sample_examples(
     examples: List[Example],
     meta_filters: Dict[str, List[str]] = {},
@@ -57,8 +81,8 @@ def sample_examples(
 
     Args:
         examples (List[Example]): Examples to sample from
-        meta_filters (Dict[str, List[str]], optional): Values to filter
-            out of sampled set for each meta field.
+        meta_filters (Dict[str, List[str]], optional): Allowed values for each
+            meta field. Examples that don't match every filter are skipped.
         fields (List[str], optional): Meta fields to use in hash.
             Defaults to all availabile fields.
         ignore_field_absence (bool, optional): Determines behavior
@@ -70,25 +94,31 @@ def sample_examples(
         List[Example]: Sampled examples
     """
 
-    examples_counter: Dict[Any, int] = defaultdict(int)
+    examples_counter: Dict[Any, int] = {}
+    n_sampled = 0
     out_examples = []
+    filter_sets = {field: frozenset(vals) for field, vals in meta_filters.items()}
 
     if shuffle:
         random.shuffle(examples)
 
     for example in examples:
-        if top_k > 0 and sum(examples_counter.values()) >= top_k:
+        if top_k > 0 and n_sampled >= top_k:
             break
 
-        for meta_field, meta_vals in meta_filters.items():
-            if example.meta[meta_field] not in meta_vals:
-                break
+        if not all(
+            _meta_value_allowed(example.meta.get(field), vals)
+            for field, vals in filter_sets.items()
+        ):
+            continue
 
         meta_hash = hash_example_meta(
             example, fields=fields, ignore_field_absence=ignore_field_absence
         )
-        if examples_counter[meta_hash] <= top_k_per_hash:
+        meta_hash_count = examples_counter.get(meta_hash, 0)
+        if meta_hash_count <= top_k_per_hash:
             out_examples.append(example)
-            examples_counter[meta_hash] += 1
+            examples_counter[meta_hash] = meta_hash_count + 1
+            n_sampled += 1
 
     return out_examples
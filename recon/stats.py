@@ -1,9 +1,20 @@
 import math
-from collections import defaultdict
-from typing import Any, DefaultDict, Dict, List, Optional, Sequence, Union, cast
+from collections import Counter, defaultdict
+from operator import attrgetter, itemgetter
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
-from scipy.spatial.distance import jensenshannon
+from scipy.special import rel_entr
 from scipy.stats import entropy as scipy_entropy
 
 from recon.constants import NOT_LABELED
@@ -20,23 +31,28 @@ def get_ner_stats(data: List[Example], return_examples: bool = False) -> Stats:
     Returns:
         Stats: Summary stats from list of Examples
     """
-    annotations_per_type: DefaultDict[str, Any] = defaultdict(int)
+    annotations_per_type: Counter[str] = Counter()
     examples: DefaultDict[str, Any] = defaultdict(list)
     n_examples_no_entities = 0
 
-    for e in data:
-        if not e.spans:
-            n_examples_no_entities += 1
-            examples[NOT_LABELED].append(e)
-        else:
-            for s in e.spans:
-                annotations_per_type[s.label] += 1
-                examples[s.label].append(e)
+    if return_examples:
+        for e in data:
+            if not e.spans:
+                n_examples_no_entities += 1
+                examples[NOT_LABELED].append(e)
+            else:
+                for s in e.spans:
+                    annotations_per_type[s.label] += 1
+                    examples[s.label].append(e)
+    else:
+        for e in data:
+            if not e.spans:
+                n_examples_no_entities += 1
+            else:
+                for s in e.spans:
+                    annotations_per_type[s.label] += 1
 
-    sorted_anns_by_count = {
-        a[0]: a[1]
-        for a in sorted(annotations_per_type.items(), key=lambda x: x[1], reverse=True)
-    }
+    sorted_anns_by_count = dict(annotations_per_type.most_common())
 
     stats = Stats(
         n_examples=len(data),
@@ -60,9 +76,9 @@ def get_sorted_type_counts(ner_stats: Stats) -> List[int]:
     Returns:
         List[int]: List of counts sorted by type name
     """
-    annotations_per_type = ner_stats.n_annotations_per_type
+    annotations_per_type = dict(ner_stats.n_annotations_per_type)
     annotations_per_type[NOT_LABELED] = ner_stats.n_examples_no_entities
-    return [t[1] for t in sorted(annotations_per_type.items(), key=lambda p: p[0])]
+    return [t[1] for t in sorted(annotations_per_type.items(), key=itemgetter(0))]
 
 
 def calculate_label_distribution_similarity(
@@ -89,16 +105,33 @@ def calculate_label_distribution_similarity(
         float: Similarity of label distributions
     """
 
-    def pipeline(data: List[Example]) -> Sequence[float]:
+    def pipeline(data: List[Example]) -> np.ndarray:
         stats = cast(Stats, get_ner_stats(data))
         sorted_type_counts = get_sorted_type_counts(stats)
         counts_to_probs = get_probs_from_counts(sorted_type_counts)
         return counts_to_probs
 
-    distance = jensenshannon(pipeline(x), pipeline(y))
+    distance = _jensenshannon(pipeline(x), pipeline(y))
     return float(1 - distance) * 100
 
 
+def _jensenshannon(p: np.ndarray, q: np.ndarray) -> float:
+    """Jensen-Shannon distance between 2 probability distributions.
+    Equivalent to scipy.spatial.distance.jensenshannon for inputs that
+    are already normalized, without normalizing them a second time.
+
+    Args:
+        p (np.ndarray): Probability distribution
+        q (np.ndarray): Probability distribution
+
+    Returns:
+        float: Jensen-Shannon distance
+    """
+    m = (p + q) / 2.0
+    js = rel_entr(p, m).sum() + rel_entr(q, m).sum()
+    return float(np.sqrt(js / 2.0))
+
+
 def get_entity_coverage(
     data: List[Example],
     sep: str = "||",
@@ -112,8 +145,8 @@ def get_entity_coverage(
 
     Args:
         data (List[Example]): List of examples
-        sep (str, optional): Separator used in coverage map, only change if
-            || exists in your text or label.
+        sep (str, optional): Unused. Coverage is keyed on (text, label) tuples
+            so any text or label is supported. Kept for backwards compatibility.
         case_sensitive (bool, optional): Consider case of text for each annotation
         return_examples (bool, optional): Return Examples that contain the
             entity label annotation.
@@ -123,28 +156,49 @@ def get_entity_coverage(
             containing the text, label, count, and an optional list of examples
             where that text/label annotation exists.
     """
-    coverage_map: DefaultDict[str, int] = defaultdict(int)
-    examples_map: DefaultDict[str, List[Example]] = defaultdict(list)
-
-    for example in data:
-        for span in example.spans:
-            text = span.text if case_sensitive else span.text.lower()
-            key = f"{text}{sep}{span.label}"
-            coverage_map[key] += 1
-            examples_map[key].append(example)
-
-    coverage = []
-    for key, count in coverage_map.items():
-        text, label = key.split(sep)
-        record = EntityCoverage(text=text, label=label, count=count)
-        if return_examples:
-            record.examples = examples_map[key]
-        coverage.append(record)
-
-    sorted_coverage = sorted(coverage, key=lambda x: x.count, reverse=True)
+    if return_examples:
+        examples_map: DefaultDict[Tuple[str, str], List[Example]] = defaultdict(list)
+        for example in data:
+            for span in example.spans:
+                text = span.text if case_sensitive else span.text_lower
+                examples_map[(text, span.label)].append(example)
+
+        coverage = [
+            EntityCoverage(
+                text=text, label=label, count=len(examples), examples=examples
+            )
+            for (text, label), examples in examples_map.items()
+        ]
+    else:
+        coverage_counts = _get_coverage_counts(data, case_sensitive=case_sensitive)
+        coverage = [
+            EntityCoverage(text=text, label=label, count=count)
+            for (text, label), count in coverage_counts.items()
+        ]
+
+    sorted_coverage = sorted(coverage, key=attrgetter("count"), reverse=True)
     return sorted_coverage
 
 
+def _get_coverage_counts(
+    data: List[Example], case_sensitive: bool = False
+) -> Dict[Tuple[str, str], int]:
+    """Count the occurrences of each (text, label) annotation in data
+
+    Args:
+        data (List[Example]): List of examples
+        case_sensitive (bool, optional): Consider case of text for each annotation
+
+    Returns:
+        Dict[Tuple[str, str], int]: Counts keyed by (text, label)
+    """
+    if case_sensitive:
+        pairs = [(s.text, s.label) for e in data for s in e.spans]
+    else:
+        pairs = [(s.text_lower, s.label) for e in data for s in e.spans]
+    return Counter(pairs)
+
+
 def calculate_entity_coverage_similarity(
     x: List[Example], y: List[Example]
 ) -> EntityCoverageStats:
@@ -165,12 +219,8 @@ def calculate_entity_coverage_similarity(
             often entities occur in each dataset x and y)
     """
 
-    def pipeline(data: List[Example]) -> Dict[int, int]:
-        ecs = get_entity_coverage(data)
-        return {hash(ec): ec.count for ec in ecs}
-
-    x_map = pipeline(x)
-    y_map = pipeline(y)
+    x_map = _get_coverage_counts(x)
+    y_map = _get_coverage_counts(y)
 
     n_intersection = 0
     count_intersection = 0
@@ -190,7 +240,7 @@ def calculate_entity_coverage_similarity(
     )
 
 
-def get_probs_from_counts(seq: List[int]) -> Sequence[float]:
+def get_probs_from_counts(seq: List[int]) -> np.ndarray:
     """Convert a sequence of counts to a sequence of probabilties
     by dividing each n by the sum of all n in seq
 
@@ -198,9 +248,10 @@ def get_probs_from_counts(seq: List[int]) -> Sequence[float]:
         seq (Sequence[int]): Sequence of counts
 
     Returns:
-        Sequence[float]: Sequence of probabilities
+        np.ndarray: Array of probabilities
     """
-    return list(np.asarray(seq) / sum(seq))
+    arr = np.asarray(seq, dtype=np.float64)
+    return arr / arr.sum()
 
 
 def _entropy(seq: Union[List[int], List[float]], total: Optional[int] = None) -> float:
@@ -268,16 +319,40 @@ def detect_outliers(seq: Sequence[Any], use_log: bool = False) -> Outliers:
 
     Args:
         seq (Sequence[Any]): Sequence of ints or floats
-        use_log (bool, optional): Use logarithm of seq.
+        use_log (bool, optional): Detect outliers on log(1 + n) of each
+            n in seq. Useful for heavily skewed counts.
 
     Returns:
         Tuple[List[int], List[int]]: Tuple of low and high indices
     """
-    q1 = np.quantile(seq, 0.25)
-    q3 = np.quantile(seq, 0.75)
+    arr = np.asarray(seq, dtype=np.float64)
+    scaled = np.log1p(arr) if use_log else arr
+    q1, q3 = np.quantile(scaled, [0.25, 0.75])
     iqr = q3 - q1
-    fence_low = math.floor(q1 - 1.5 * iqr)
-    fence_high = math.floor(q3 + 1.5 * iqr)
-    low_indices = [i for i, n in enumerate(seq) if n <= fence_low]
-    high_indices = [i for i, n in enumerate(seq) if n > fence_high]
+    fence_low = q1 - 1.5 * iqr
+    fence_high = q3 + 1.5 * iqr
+    if use_log:
+        # Map the fences back to the original scale before flooring them
+        fence_low, fence_high = np.expm1([fence_low, fence_high])
+    low_indices, high_indices = _fence_indices(
+        arr, math.floor(fence_low), math.floor(fence_high)
+    )
     return Outliers(low=low_indices, high=high_indices)
+
+
+def _fence_indices(
+    arr: np.ndarray, fence_low: float, fence_high: float
+) -> Tuple[List[int], List[int]]:
+    """Get the indices of values outside the fences of an outlier test.
+
+    Args:
+        arr (np.ndarray): Array of values
+        fence_low (float): Values less than or equal to this are low outliers
+        fence_high (float): Values greater than this are high outliers
+
+    Returns:
+        Tuple[List[int], List[int]]: Tuple of low and high indices
+    """
+    low_indices = np.flatnonzero(arr <= fence_low).tolist()
+    high_indices = np.flatnonzero(arr > fence_high).tolist()
+    return low_indices, high_indices
@@ -10,8 +10,9 @@ from recon.util import ensure_path
 class ExampleStore:
     def __init__(self, examples: List[Example] = []):
         self._map: Dict[int, Example] = {}
+        self._strings: Dict[str, str] = {}
         for e in examples:
-            self.add(e.model_copy(deep=True))
+            self.add(e)
 
     def __getitem__(self, example_hash: int) -> Example:
         return self._map[example_hash]
@@ -37,45 +38,94 @@ class ExampleStore:
         return example_hash in self._map
 
     def add(self, example: Example) -> None:
-        """Add an Example to the store
+        """Add an Example to the store. The store keeps its own deep copy
+        since operations are free to modify the original Example in place.
 
         Args:
             example (Example): example to add
         """
         example_hash = hash(example)
         if example_hash not in self:
-            self._map[example_hash] = example.model_copy(deep=True)
+            example = example.model_copy(deep=True)
+            self._map[example_hash] = self._intern_strings(example)
 
-    def from_disk(self, path: Union[str, Path]) -> "ExampleStore":
-        """Load store from disk
+    def _intern_strings(self, example: Example) -> Example:
+        """Share span labels and span/token texts across the examples in the
+        store. The same labels and surface forms repeat across most examples
+        so each distinct string is only kept once.
+
+        Args:
+            example (Example): Example to update in place
+
+        Returns:
+            Example: The same Example
+        """
+        strings = self._strings
+        for span in example.spans:
+            text = strings.setdefault(span.text, span.text)
+            if text is not span.text:
+                span.text = text
+            label = strings.setdefault(span.label, span.label)
+            if label is not span.label:
+                span.label = label
+        for token in example.tokens or []:
+            text = strings.setdefault(token.text, token.text)
+            if text is not token.text:
+                token.text = text
+        return example
+
+    def from_disk(self, path: Union[str, Path], verify: bool = False) -> "ExampleStore":
+        """Load store from disk. Files with a .jsonl suffix are read as JSONL,
+        anything else is read as msgpack.
 
         Args:
             path (Path): Path to file to load from
+            verify (bool, optional): Recompute the hash of each loaded example
+                and check it against the hash saved with it. By default the
+                saved hash is trusted since it was written by `to_disk`.
+
+        Raises:
+            ValueError: If verify is True and a saved hash doesn't match
 
         Returns:
             ExampleStore: Initialized ExampleStore
         """
         path = ensure_path(path)
-        examples = srsly.read_jsonl(path)
+        if path.suffix == ".jsonl":
+            examples = srsly.read_jsonl(path)
+        else:
+            examples = cast(List[Dict[str, Any]], srsly.read_msgpack(path))
         for e in examples:
             e = cast(Dict[str, Any], e)
-            raw_example = e["example"]
-            example = Example(**raw_example)
-            self.add(example)
+            example_hash = e["example_hash"]
+            if example_hash in self._map:
+                continue
+            example = Example.model_validate(e["example"])
+            if verify and hash(example) != example_hash:
+                raise ValueError(
+                    f"Hash mismatch loading {example} from {path}. Saved hash"
+                    f" {example_hash} does not match computed hash {hash(example)}."
+                )
+            self._map[example_hash] = self._intern_strings(example)
 
         return self
 
     def to_disk(self, path: Union[str, Path]) -> None:
-        """Save store to disk
+        """Save store to disk. Files with a .jsonl suffix are written as JSONL,
+        anything else is written as msgpack.
 
         Args:
             path (Path): Path to save store to
         """
         path = ensure_path(path)
-        examples = []
-        for example_hash, example in self._map.items():
-            examples.append(
-                {"example_hash": example_hash, "example": example.model_dump()}
-            )
-
-        srsly.write_jsonl(path, examples)
+        # Generate records lazily so JSONL is written one line at a time
+        # instead of holding every dumped example in memory at once
+        examples = (
+            {"example_hash": example_hash, "example": example.model_dump()}
+            for example_hash, example in self._map.items()
+        )
+
+        if path.suffix == ".jsonl":
+            srsly.write_jsonl(path, examples)
+        else:
+            srsly.write_msgpack(path, list(examples))
@@ -23,25 +23,29 @@ def add_tokens(
     doc = preprocessed_outputs["recon.spacy.v1"]
 
     tokens = []
-    token_starts = {}
-    token_ends = {}
+    # Map character offsets straight to token ids
+    token_starts: Dict[int, int] = {}
+    token_ends: Dict[int, int] = {}
 
     for t in doc:
+        i = t.i
         start = t.idx
-        end = t.idx + len(t)
-        tokens.append(Token(text=t.text, start=start, end=end, id=t.i))
-        token_starts[start] = t
-        token_ends[end] = t
+        end = start + len(t)
+        tokens.append(Token(text=t.text, start=start, end=end, id=i))
+        token_starts[start] = i
+        token_ends[end] = i
 
     example.tokens = tokens
 
+    # spaCy token ends are exclusive, recon token ends are inclusive
+    token_end_offset = 1 if use_spacy_token_ends else 0
+
     for span in example.spans:
-        if span.start in token_starts and span.end in token_ends:
-            span.token_start = token_starts[span.start].i
-            if use_spacy_token_ends:
-                span.token_end = token_ends[span.end].i + 1
-            else:
-                span.token_end = token_ends[span.end].i
+        token_start = token_starts.get(span.start)
+        token_end = token_ends.get(span.end)
+        if token_start is not None and token_end is not None:
+            span.token_start = token_start
+            span.token_end = token_end + token_end_offset
 
         if span.token_start is None or span.token_end is None:
             return None
@@ -1,7 +1,9 @@
+import copy
 import sys
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -9,6 +11,7 @@ from typing import (
     Dict,
     Iterable,
     List,
+    Mapping,
     Optional,
     Protocol,
     Tuple,
@@ -17,7 +20,7 @@ from typing import (
 )
 from typing_extensions import ParamSpec
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from spacy import displacy
 from spacy.tokens import Doc
 from spacy.tokens import Span as SpacySpan
@@ -25,7 +28,13 @@ from spacy.util import get_words_and_spaces
 from spacy.vocab import Vocab
 from wasabi import color
 
-from recon.hashing import example_hash, prediction_error_hash, span_hash, token_hash
+from recon.hashing import (
+    example_hash,
+    prediction_error_hash,
+    span_example_hash_data,
+    span_hash,
+    token_hash,
+)
 
 if TYPE_CHECKING:
     from pydantic.typing import ReprArgs
@@ -38,6 +47,22 @@ ANSI_HIGHLIGHT = 222
 ANSI_BLACK = "black"
 
 
+_SHARED_VOCAB: Optional[Vocab] = None
+
+
+def _get_vocab() -> Vocab:
+    """Get the Vocab shared by all Docs built from Examples.
+    Creating a new Vocab for each Doc costs more than building the Doc itself.
+
+    Returns:
+        Vocab: Shared spaCy Vocab
+    """
+    global _SHARED_VOCAB
+    if _SHARED_VOCAB is None:
+        _SHARED_VOCAB = Vocab()
+    return _SHARED_VOCAB
+
+
 class Span(BaseModel):
     """Entity Span in Example"""
 
@@ -50,13 +75,44 @@ class Span(BaseModel):
     kb_id: Optional[str] = None
     source: Optional[str] = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Drop values cached from the previous field values
+        cached = self.__dict__
+        cached.pop("hash", None)
+        cached.pop("_example_hash_data", None)
+        if name == "text":
+            cached.pop("text_lower", None)
+        super().__setattr__(name, value)
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Span":
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # pydantic writes updates straight to __dict__, bypassing __setattr__
+            cached = copied.__dict__
+            cached.pop("hash", None)
+            cached.pop("_example_hash_data", None)
+            if "text" in update:
+                cached.pop("text_lower", None)
+        return copied
+
     def __hash__(self) -> int:
         return self.hash
 
-    @property
+    @cached_property
     def hash(self) -> int:
         return span_hash(self)
 
+    @cached_property
+    def _example_hash_data(self) -> bytes:
+        return span_example_hash_data(self)
+
+    @cached_property
+    def text_lower(self) -> str:
+        """Lowercased span text, cached until the text is reassigned"""
+        return self.text.lower()
+
 
 class Token(BaseModel):
     """Token with offsets into Example Text"""
@@ -66,10 +122,24 @@ class Token(BaseModel):
     end: int
     id: int
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Drop the hash cached from the previous field values
+        self.__dict__.pop("hash", None)
+        super().__setattr__(name, value)
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Token":
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # pydantic writes updates straight to __dict__, bypassing __setattr__
+            copied.__dict__.pop("hash", None)
+        return copied
+
     def __hash__(self) -> int:
         return self.hash
 
-    @property
+    @cached_property
     def hash(self) -> int:
         return token_hash(self)
 
@@ -80,7 +150,7 @@ class Example(BaseModel):
     text: str
     spans: List[Span]
     tokens: Optional[List[Token]] = None
-    meta: Dict[str, Any] = {}
+    meta: Dict[str, Any] = Field(default_factory=dict)
 
     @model_validator(mode="before")
     @classmethod
@@ -118,6 +188,19 @@ class Example(BaseModel):
     def hash(self) -> int:
         return example_hash(self)
 
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "Example":
+        # Spans and Tokens only hold immutable scalar fields so shallow copies
+        # of each are full copies and skip the generic deepcopy recursion.
+        # This is also what model_copy(deep=True) calls.
+        tokens = self.tokens
+        copied = self.__copy__()
+        copied.__dict__.update(
+            spans=[s.model_copy() for s in self.spans],
+            tokens=None if tokens is None else [t.model_copy() for t in tokens],
+            meta=copy.deepcopy(self.meta, memo),
+        )
+        return copied
+
     @property
     def doc(self) -> Doc:
         """Return spaCy Doc representation of Example
@@ -131,7 +214,7 @@ class Example(BaseModel):
             )
         tokens = [token.text for token in self.tokens]
         words, spaces = get_words_and_spaces(tokens, self.text)
-        doc = Doc(Vocab(), words=words, spaces=spaces)
+        doc = Doc(_get_vocab(), words=words, spaces=spaces)
         spans = [doc.char_span(s.start, s.end, label=s.label) for s in self.spans]
 
         doc.set_ents(cast(List[SpacySpan], spans))
@@ -173,19 +256,19 @@ class Example(BaseModel):
         """
         text = self.text
         spans = self.spans
-        result = ""
+        parts = []
         offset = 0
         for span in spans:
             label = span.label
             start = span.start
             end = span.end
-            result += text[offset:start]
-            result += color(f" {text[start:end]} ", ANSI_BLACK, highlight_color)
+            parts.append(text[offset:start])
+            parts.append(color(f" {text[start:end]} ", ANSI_BLACK, highlight_color))
             if label:
-                result += color(f" {label} ", ANSI_BLACK, label_color)
+                parts.append(color(f" {label} ", ANSI_BLACK, label_color))
             offset = end
-        result += text[offset:]
-        print(result)
+        parts.append(text[offset:])
+        print("".join(parts))
 
 
 class OperationProtocol(Protocol[_OpParams]):
@@ -342,7 +425,7 @@ class PredictionError(BaseModel):
     true_label: str
     pred_label: str
     count: int
-    examples: Optional[List[PredictionErrorExamplePair]] = []
+    examples: Optional[List[PredictionErrorExamplePair]] = Field(default_factory=list)
 
     def __hash__(self) -> int:
         return self.hash
@@ -372,7 +455,7 @@ class ExampleDiff(BaseModel):
         assert combined.tokens is not None
         tokens = [token.text for token in combined.tokens]
         words, spaces = get_words_and_spaces(tokens, combined.text)
-        doc = Doc(Vocab(), words=words, spaces=spaces)
+        doc = Doc(_get_vocab(), words=words, spaces=spaces)
         ref_spans = [
             doc.char_span(s.start, s.end, label=s.label) for s in combined.spans
         ]
@@ -397,7 +480,7 @@ class LabelDisparity(BaseModel):
     label1: str
     label2: str
     count: int
-    examples: Optional[List[Example]] = []
+    examples: Optional[List[Example]] = Field(default_factory=list)
 
 
 class Stats(BaseModel):
@@ -426,7 +509,7 @@ class EntityCoverage(BaseModel):
     text: str
     label: str
     count: int
-    examples: Optional[List[Example]] = []
+    examples: Optional[List[Example]] = Field(default_factory=list)
 
     def __hash__(self) -> int:
         return hash((self.text, self.label))
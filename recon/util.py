@@ -1,6 +1,10 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import spacy
+from spacy.language import Language
+
 
 def ensure_path(path: Any) -> Path:
     """Ensure string is converted to a Path.
@@ -13,3 +17,16 @@ def ensure_path(path: Any) -> Path:
     if not isinstance(path, (str, Path)):
         raise TypeError("type of positional argument 'path' must be a string or Path")
     return Path(path) if isinstance(path, str) else path
+
+
+@lru_cache(maxsize=8)
+def get_blank_nlp(lang: str = "en") -> Language:
+    """Get a blank spaCy pipeline for a language, created once per process.
+
+    Args:
+        lang (str, optional): Language code. Defaults to "en".
+
+    Returns:
+        Language: Shared blank spaCy pipeline
+    """
+    return spacy.blank(lang)
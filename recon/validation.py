@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import List
 
 from recon.operations import operation
@@ -29,7 +30,7 @@ def filter_overlaps(example: Example) -> Example:
     Returns:
         List[Example]: Example with fixed overlaps
     """
-    annotations: List[Span] = sorted(example.spans, key=lambda s: s.start)
+    annotations: List[Span] = sorted(example.spans, key=attrgetter("start"))
     filtered_annotations = remove_overlapping_entities(annotations)
     example.spans = filtered_annotations
 
@@ -44,23 +45,15 @@ def select_subset_of_overlapping_chain(chain: List[Span]) -> List[Span]:
     """
     sorted_chain = sorted(chain, key=lambda s: s.end - s.start, reverse=True)
     selections_from_chain: List[Span] = []
-    chain_index = 0
     # dump the current chain by greedily keeping the longest entity that doesn't overlap
-    while chain_index < len(sorted_chain):
-        entity = sorted_chain[chain_index]
-        match_found = False
-        for already_selected_entity in selections_from_chain:
-            max_start = max(entity.start, already_selected_entity.start)
-            min_end = min(entity.end, already_selected_entity.end)
-            if len(range(max_start, min_end)) > 0:
-                match_found = True
-                break
-
-        if not match_found:
+    for entity in sorted_chain:
+        # Spans overlap if the latest start is before the earliest end
+        if not any(
+            min(entity.end, selected.end) > max(entity.start, selected.start)
+            for selected in selections_from_chain
+        ):
             selections_from_chain.append(entity)
 
-        chain_index += 1
-
     return selections_from_chain
 
 
@@ -74,12 +67,11 @@ def remove_overlapping_entities(sorted_spans: List[Span]) -> List[Span]:
     current_overlapping_chain: List[Span] = []
     current_overlapping_chain_start = 0
     current_overlapping_chain_end = 0
-    for i, current_entity in enumerate(sorted_spans):
-        current_entity = sorted_spans[i]
+    for current_entity in sorted_spans:
         current_entity_start = current_entity.start
         current_entity_end = current_entity.end
 
-        if len(current_overlapping_chain) == 0:
+        if not current_overlapping_chain:
             current_overlapping_chain.append(current_entity)
             current_overlapping_chain_start = current_entity_start
             current_overlapping_chain_end = current_entity_end
@@ -109,4 +101,5 @@ def remove_overlapping_entities(sorted_spans: List[Span]) -> List[Span]:
         select_subset_of_overlapping_chain(current_overlapping_chain)
     )
 
-    return sorted(spans_without_overlap, key=lambda x: x.start)
+    spans_without_overlap.sort(key=attrgetter("start"))
+    return spans_without_overlap
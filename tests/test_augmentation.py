@@ -1,4 +1,4 @@
-from recon.augmentation import ent_label_sub  # noqa
+from recon.augmentation import ent_label_sub, substitute_spans  # noqa
 from recon.dataset import Dataset
 from recon.types import Example, Span
 
@@ -37,3 +37,32 @@ def test_ent_label_substitution():
     assert len(ds) == 2
     assert example in ds.data
     assert expected_augmentation in ds.data
+
+
+def test_substitute_spans_offsets():
+    example = Example(
+        text="aa bb cc dd",
+        spans=[
+            Span(text="aa", start=0, end=2, label="ENTITY"),
+            Span(text="bb", start=3, end=5, label="ENTITY"),
+            Span(text="cc", start=6, end=8, label="ENTITY"),
+            Span(text="dd", start=9, end=11, label="ENTITY"),
+        ],
+    )
+    span_subs = {
+        example.spans[0]: "XXXX",
+        example.spans[2]: "Y",
+        example.spans[3]: "Q",
+    }
+
+    result = substitute_spans(example, span_subs)
+
+    assert result.text == "XXXX bb Y Q"
+    assert [(s.start, s.end, s.text) for s in result.spans] == [
+        (0, 4, "XXXX"),
+        (5, 7, "bb"),
+        (8, 9, "Y"),
+        (10, 11, "Q"),
+    ]
+    for span in result.spans:
+        assert result.text[span.start : span.end] == span.text
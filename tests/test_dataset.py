@@ -185,3 +185,16 @@ def test_dataset_to_from_spacy(example_data: Dict[str, List[Example]], tmp_path:
 
     ner_stats_post: Stats = cast(Stats, train_dataset_loaded.apply(get_ner_stats))
     assert ner_stats_pre == ner_stats_post
+
+
+def test_dataset_stats_cached(example_data: Dict[str, List[Example]]):
+    dataset = Dataset("train", example_data["train"], verbose=False)
+    stats = dataset.stats
+    assert dataset.stats is stats
+
+    dataset.apply_("recon.upcase_labels.v1")
+    assert dataset.stats is not stats
+    assert "skill" not in dataset.stats.n_annotations_per_type
+
+    dataset.data.append(Example(text="New example", spans=[]))
+    assert dataset.stats.n_examples == len(dataset)
@@ -1,6 +1,6 @@
 from typing import Any, Dict
 
-from recon.types import Example
+from recon.types import Example, Span, Token
 
 
 def test_example_init():
@@ -24,3 +24,90 @@ def test_example_init_text_only():
     assert example.text == "text no spans"
     assert example.spans == []
     assert example.tokens is None
+
+
+def test_span_text_lower():
+    example = Example(
+        text="Machine Learning", spans=[{"start": 0, "end": 7, "label": "SKILL"}]
+    )
+    span = example.spans[0]
+    assert span.text_lower == "machine"
+
+    span.text = "Learning"
+    assert span.text_lower == "learning"
+    assert "text_lower" not in span.model_dump()
+
+    copied = span.model_copy(update={"text": "Deep"})
+    assert copied.text_lower == "deep"
+    assert span.text_lower == "learning"
+
+
+def test_example_hash_changes_with_span():
+    example = Example(
+        text="Machine Learning", spans=[{"start": 0, "end": 7, "label": "SKILL"}]
+    )
+    orig_example_hash = hash(example)
+    orig_span_hash = hash(example.spans[0])
+    assert hash(example) == orig_example_hash
+
+    example.spans[0].label = "skill"
+    assert hash(example.spans[0]) != orig_span_hash
+    assert hash(example) != orig_example_hash
+
+    example.spans[0].label = "SKILL"
+    assert hash(example.spans[0]) == orig_span_hash
+    assert hash(example) == orig_example_hash
+
+
+def test_span_model_copy_update_hash():
+    example = Example(
+        text="Machine Learning", spans=[{"start": 0, "end": 7, "label": "SKILL"}]
+    )
+    span = example.spans[0]
+    orig_example_hash = hash(example)
+
+    copied = span.model_copy(update={"label": "TOPIC"})
+    assert hash(copied) == hash(Span(text="Machine", start=0, end=7, label="TOPIC"))
+    assert hash(copied) != hash(span)
+
+    example.spans = [copied]
+    assert hash(example) != orig_example_hash
+
+
+def test_example_deep_copy():
+    example = Example(
+        text="Machine Learning",
+        spans=[{"start": 0, "end": 7, "label": "SKILL"}],
+        tokens=[
+            {"text": "Machine", "start": 0, "end": 7, "id": 0},
+            {"text": "Learning", "start": 8, "end": 16, "id": 1},
+        ],
+        meta={"source": ["a"]},
+    )
+    copied = example.model_copy(deep=True)
+    assert copied == example
+    assert hash(copied) == hash(example)
+    assert copied.model_fields_set == example.model_fields_set
+
+    copied.spans[0].label = "OTHER"
+    copied.tokens[0].text = "machine"
+    copied.meta["source"].append("b")
+    assert example.spans[0].label == "SKILL"
+    assert example.tokens[0].text == "Machine"
+    assert example.meta == {"source": ["a"]}
+
+
+def test_token_hash_changes_with_token():
+    token = Token(text="Machine", start=0, end=7, id=0)
+    orig_token_hash = hash(token)
+    assert "hash" not in token.model_dump()
+
+    token.text = "machine"
+    assert hash(token) != orig_token_hash
+
+    token.text = "Machine"
+    assert hash(token) == orig_token_hash
+
+    copied = token.model_copy(update={"id": 1})
+    assert hash(copied) == hash(Token(text="Machine", start=0, end=7, id=1))
+    assert hash(copied) != orig_token_hash
@@ -0,0 +1,37 @@
+from typing import List
+
+import pytest
+
+from recon.sample import sample_examples
+from recon.types import Example
+
+
+@pytest.fixture()
+def meta_examples() -> List[Example]:
+    return [
+        Example(text=f"Example {i}", spans=[], meta={"source": source})
+        for i, source in enumerate(["a", "a", "b", "b", "c"])
+    ]
+
+
+def test_sample_examples_meta_filters(meta_examples: List[Example]):
+    sampled = sample_examples(meta_examples, meta_filters={"source": ["a", "c"]})
+    assert len(sampled) == 3
+    assert {e.meta["source"] for e in sampled} == {"a", "c"}
+
+
+def test_sample_examples_top_k(meta_examples: List[Example]):
+    sampled = sample_examples(meta_examples, top_k=2)
+    assert len(sampled) == 2
+
+
+def test_sample_examples_meta_filters_list_values():
+    examples = [
+        Example(text="a", spans=[], meta=["x"]),
+        Example(text="b", spans=[], meta=["y", "z"]),
+    ]
+    sampled = sample_examples(examples, meta_filters={"source": ["x", "z"]})
+    assert {e.text for e in sampled} == {"a", "b"}
+
+    sampled = sample_examples(examples, meta_filters={"source": ["x"]})
+    assert [e.text for e in sampled] == ["a"]
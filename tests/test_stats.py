@@ -77,3 +77,42 @@ def test_detect_outliers():
     outliers = detect_outliers(seq)
     assert outliers.low == [0]
     assert outliers.high == [11]
+
+
+def test_get_entity_coverage_sep_in_text():
+    examples = [
+        Example(
+            text="Use a || b here",
+            spans=[{"start": 4, "end": 10, "label": "OP"}],
+        ),
+        Example(
+            text="Also a || b",
+            spans=[{"start": 5, "end": 11, "label": "OP"}],
+        ),
+    ]
+    coverage = get_entity_coverage(examples)
+    assert len(coverage) == 1
+    assert coverage[0].text == "a || b"
+    assert coverage[0].label == "OP"
+    assert coverage[0].count == 2
+
+
+def test_detect_outliers_use_log():
+    seq = [10, 12, 15, 20, 30, 50, 80, 120, 200, 400, 5_000, 200_000]
+
+    outliers = detect_outliers(seq)
+    assert outliers.low == []
+    assert outliers.high == [10, 11]
+
+    # The log space high fence maps back to roughly 10_148
+    log_outliers = detect_outliers(seq, use_log=True)
+    assert log_outliers.low == []
+    assert log_outliers.high == [11]
+
+
+def test_detect_outliers_use_log_fences_in_original_scale():
+    # The log space fences map back to roughly [74, 312], so nothing is an outlier
+    seq = [100, 110, 120, 130, 140, 150, 160, 170, 180, 190, 200, 260]
+    outliers = detect_outliers(seq, use_log=True)
+    assert outliers.low == []
+    assert outliers.high == []
@@ -0,0 +1,47 @@
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+import srsly
+
+from recon.store import ExampleStore
+from recon.types import Example
+
+
+@pytest.mark.parametrize("suffix", [".msgpack", ".jsonl"])
+def test_store_to_from_disk(
+    example_data: Dict[str, List[Example]], tmp_path: Path, suffix: str
+):
+    store = ExampleStore(example_data["train"])
+    path = tmp_path / f"example_store{suffix}"
+    store.to_disk(path)
+
+    loaded = ExampleStore().from_disk(path, verify=True)
+    assert len(loaded) == len(store)
+    for example in example_data["train"]:
+        assert example in loaded
+
+
+def test_store_from_disk_verify(tmp_path: Path):
+    example = Example(text="Some text", spans=[])
+    path = tmp_path / "example_store.jsonl"
+    srsly.write_jsonl(path, [{"example_hash": 1, "example": example.model_dump()}])
+
+    assert 1 in ExampleStore().from_disk(path)
+    with pytest.raises(ValueError):
+        ExampleStore().from_disk(path, verify=True)
+
+
+def test_store_shares_strings():
+    examples = [
+        Example(
+            text=f"I use Python {i}",
+            spans=[{"text": "Python", "start": 6, "end": 12, "label": "SKILL"}],
+        )
+        for i in range(2)
+    ]
+    store = ExampleStore(examples)
+    first, second = (store[hash(e)] for e in examples)
+    assert first.spans[0].text is second.spans[0].text
+    assert first.spans[0].label is second.spans[0].label
+    assert hash(first) == hash(examples[0])
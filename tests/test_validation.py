@@ -5,7 +5,7 @@ import pytest
 from recon.corpus import Corpus
 from recon.stats import get_ner_stats
 from recon.types import Example, Span, Stats
-from recon.validation import filter_overlaps
+from recon.validation import filter_overlaps, select_subset_of_overlapping_chain
 
 
 @pytest.fixture()
@@ -103,3 +103,13 @@ def test_filter_overlaps():
     test_entities = [(445, 502, "ENTITY"), (461, 473, "ENTITY"), (474, 489, "ENTITY")]
     result = cast(Example, filter_overlaps(get_test_example(test_entities)))
     assert spans_to_offsets(result.spans) == [(445, 502, "ENTITY")]
+
+
+def test_select_subset_of_overlapping_chain_empty_span():
+    chain = [
+        Span(text="x" * 10, start=0, end=10, label="ENTITY"),
+        Span(text="", start=5, end=5, label="ENTITY"),
+        Span(text="x" * 4, start=6, end=10, label="ENTITY"),
+    ]
+    selected = select_subset_of_overlapping_chain(chain)
+    assert [(s.start, s.end) for s in selected] == [(0, 10), (5, 5)]